@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
+import polars as pl
 import numpy as np
+import os
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
@@ -50,47 +52,229 @@ st.markdown("""
 # -------------------------
 # LOAD DATA FUNCTION
 # -------------------------
-@st.cache_data
+DATA_PATH = "best sellin books 2023.csv"
+CLEAN_DATA_PATH = "books_clean.parquet"
+
+# Cached as a shared resource so reruns get the same frame back without a
+# pickle round trip. Treat it as read-only: filter into new frames and never
+# modify the returned objects in place
+@st.cache_resource
 def load_data():
+    """Load the cleaned dataset along with the sidebar filter options"""
+    # Reuse the cleaned Parquet copy unless the CSV or this cleaning code
+    # has changed since it was written
+    sources = [p for p in (DATA_PATH, __file__) if os.path.exists(p)]
+    df = None
+    if os.path.exists(CLEAN_DATA_PATH) and all(
+        os.path.getmtime(CLEAN_DATA_PATH) >= os.path.getmtime(p) for p in sources
+    ):
+        try:
+            df = pd.read_parquet(CLEAN_DATA_PATH)
+        except (OSError, ValueError):
+            # Unreadable cache file - fall through and rebuild it from the CSV
+            df = None
+    if df is None:
+        df = clean_data()
+        if df is None:
+            return None
+    
+    # Filter options never change after load, so build them once here.
+    # Categories are already sorted, so no per-rerun unique() + sorted()
+    genre_options = df["Genre"].cat.categories.tolist()
+    author_options = df["Author"].cat.categories.tolist()
+    # Formats keep their first-appearance order in the dataset
+    format_options = df["form"].unique().tolist()
+    year_options = sorted(df["Year"].dropna().unique().tolist(), reverse=True)
+    
+    # Quick Stats are invariant too; categories hold exactly the distinct values
+    quick_stats = {"n": len(df), "n_genres": len(genre_options), "n_authors": len(author_options)}
+    
+    return df, genre_options, author_options, format_options, year_options, quick_stats
+
+def clean_data():
     """Load and clean the bestselling books dataset"""
     try:
-        df = pd.read_csv("best sellin books 2023.csv", encoding="latin1")
+        # The CSV is latin-1 encoded, which the lazy scanner can't decode,
+        # so read it eagerly and hand the frame to the lazy engine
+        raw = pl.read_csv(DATA_PATH, encoding="latin1")
     except FileNotFoundError:
         st.error("⚠️ Dataset file not found. Please upload 'best sellin books 2023.csv'")
         return None
     
-    # Data Cleaning Pipeline
-    # 1. Clean Rating - Extract numeric value
-    df["Rating"] = df["Rating"].str.extract(r"(\d+\.\d+)").astype(float)
+    # Data Cleaning Pipeline - built as one lazy query so Polars can fuse
+    # the column expressions and materialize the frame once
+    df = (
+        raw.lazy()
+        .with_columns([
+            # 1. Clean Rating - Extract numeric value
+            pl.col("Rating").str.extract(r"(\d+\.\d+)", 1).cast(pl.Float64),
+            # 2. Clean Price - Remove $ and convert to float
+            pl.col("price").str.replace_all(r"[\$,]", "").cast(pl.Float64),
+            # 3. Clean Rank - Remove # symbol
+            pl.col("id").str.replace("#", "", literal=True).cast(pl.Int16).alias("Rank"),
+            # 4. Convert Publishing Date - the CSV mixes two layouts, so try
+            # each explicit format instead of letting Polars infer one
+            pl.coalesce(
+                pl.col("Publishing date").str.strip_chars().str.to_datetime(format=fmt, strict=False)
+                for fmt in ("%d/%m/%Y", "%B %d, %Y")
+            ).alias("Publishing date"),
+            # 6. Handle missing values
+            pl.col("Reading age").fill_null("Not Specified"),
+            # Downcast counts to the narrowest type that holds them
+            pl.col("reviews count").cast(pl.Int32),
+            pl.col("Print Length").cast(pl.Int16),
+        ])
+        .with_columns([
+            pl.col("Publishing date").dt.year().cast(pl.Int16).alias("Year"),
+            pl.col("Publishing date").dt.month().cast(pl.Int8).alias("Month"),
+            # 5. Create calculated fields - price and Rating stay float64 so
+            # downloads, hovers and revenue show the exact parsed values
+            (pl.col("price") * pl.col("reviews count")).alias("Estimated Revenue"),
+            # Popularity stays in float32 end to end, with no float64 log temporary
+            (pl.col("Rating").cast(pl.Float32) * pl.col("reviews count").cast(pl.Float32).log1p()).alias("Popularity Score"),
+        ])
+        .collect()
+    )
     
-    # 2. Clean Price - Remove $ and convert to float
-    df["price"] = df["price"].replace('[\$,]', '', regex=True).astype(float)
+    # Plotly and the Streamlit widgets below work on pandas frames. Keep them
+    # NumPy-backed so empty filter results aggregate to NaN rather than pd.NA
+    df = df.to_pandas()
     
-    # 3. Clean Rank - Remove # symbol
-    df["Rank"] = df["id"].str.replace("#", "").astype(int)
+    # 7. Store the filter/group columns as sorted categoricals
+    for col in ("Genre", "Author", "form"):
+        df[col] = df[col].astype(pd.CategoricalDtype(sorted(df[col].dropna().unique())))
     
-    # 4. Convert Publishing Date
-    df["Publishing date"] = pd.to_datetime(df["Publishing date"], errors="coerce")
-    df["Year"] = df["Publishing date"].dt.year
-    df["Month"] = df["Publishing date"].dt.month
+    # 8. Persist the cleaned frame so later cold starts skip the CSV pipeline.
+    # Write to a temp file and swap it in, so a failed write never leaves a
+    # half-written cache behind
+    tmp_path = f"{CLEAN_DATA_PATH}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, CLEAN_DATA_PATH)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return df
+
+# -------------------------
+# GROUP STATS FUNCTION
+# -------------------------
+@st.cache_data(show_spinner=False, max_entries=64)
+def compute_group_stats(data):
+    """Aggregate genre, author and yearly stats for a (filtered) frame"""
+    # Named aggregations produce the final column names in one pass and
+    # observed=True skips empty categoricals. Genres stay sorted so the
+    # revenue pie keeps a stable color per genre
+    genre_stats = data.groupby("Genre", as_index=False, observed=True).agg(**{
+        "Avg Rating": ("Rating", "mean"),
+        "Total Reviews": ("reviews count", "sum"),
+        "Est Revenue": ("Estimated Revenue", "sum"),
+        "Book Count": ("Book name", "size")
+    })
+    
+    # Authors are only ranked with nlargest, so skip sorting the keys
+    author_stats = data.groupby("Author", as_index=False, observed=True, sort=False).agg(**{
+        "Total Reviews": ("reviews count", "sum"),
+        "Avg Rating": ("Rating", "mean"),
+        "Est Revenue": ("Estimated Revenue", "sum"),
+        "Book Count": ("Book name", "size")
+    })
+    
+    # Years stay sorted for the line chart; books without a publication
+    # date drop out of the groupby keys
+    yearly_trend = data.groupby("Year", as_index=False).agg(**{
+        "Book Count": ("Book name", "size"),
+        "Avg Rating": ("Rating", "mean"),
+        "Total Reviews": ("reviews count", "sum")
+    })
+    
+    return {"genre": genre_stats, "author": author_stats, "year": yearly_trend}
+
+# -------------------------
+# TOP PERFORMERS FUNCTION
+# -------------------------
+@st.cache_data(show_spinner=False, max_entries=64)
+def compute_top_positions(data, n=10):
+    """Row positions of the top-n books by reviews, rating and revenue"""
+    positions = {}
+    for key, col in (("reviews", "reviews count"), ("rating", "Rating"), ("revenue", "Estimated Revenue")):
+        values = data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        # A stable sort keeps nlargest's first-occurrence order for tied values
+        order = np.argsort(-values, kind="stable")
+        positions[key] = order[~np.isnan(values[order])][:n]
+    return positions
+
+# -------------------------
+# FILTER FUNCTION
+# -------------------------
+@st.cache_data(show_spinner=False, max_entries=64)
+def apply_filters(genres, authors, price_range, rating_min, fmt, year):
+    """Filter the dataset, memoized on the hashable sidebar widget values"""
+    df = load_data()[0]
+    
+    # Every mask is built against the full frame as a NumPy array and the
+    # frame is indexed once, rather than slicing a copy per filter
+    all_rows = np.ones(len(df), dtype=bool)
+    
+    if "All Genres" in genres or len(genres) == 0:
+        genre_mask = all_rows
+    else:
+        genre_mask = df["Genre"].isin(genres).to_numpy()
     
-    # 5. Create calculated fields
-    df["Estimated Revenue"] = df["price"] * df["reviews count"]
-    df["Popularity Score"] = df["Rating"] * np.log1p(df["reviews count"])
+    if "All Authors" in authors or len(authors) == 0:
+        author_mask = all_rows
+    else:
+        author_mask = df["Author"].isin(authors).to_numpy()
     
-    # 6. Handle missing values
-    df["Reading age"] = df["Reading age"].fillna("Not Specified")
+    prices = df["price"].to_numpy(dtype=float, na_value=np.nan)
+    price_mask = (prices >= price_range[0]) & (prices <= price_range[1])
     
-    return df
+    ratings = df["Rating"].to_numpy(dtype=float, na_value=np.nan)
+    rating_mask = ratings >= rating_min
+    
+    if fmt != "All Formats":
+        format_mask = (df["form"] == fmt).to_numpy()
+    else:
+        format_mask = all_rows
+    
+    if year != "All Years":
+        year_mask = (df["Year"] == year).to_numpy(dtype=bool, na_value=False)
+    else:
+        year_mask = all_rows
+    
+    return df.loc[np.logical_and.reduce([
+        genre_mask, author_mask, price_mask, rating_mask, format_mask, year_mask
+    ])]
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def export_csv(*filters):
+    """Serialize the filtered rows to CSV, memoized on the same filter values"""
+    return apply_filters(*filters).to_csv(index=False)
+
+# -------------------------
+# CHART FUNCTION
+# -------------------------
+# Each filter combination builds about a dozen charts, so keep room for
+# roughly as many filter states as the other per-filter caches
+@st.cache_data(show_spinner=False, max_entries=64 * 12)
+def build_figure(chart, data, layout=None, **kwargs):
+    """Build a Plotly Express chart, memoized as a plain figure dict"""
+    fig = getattr(px, chart)(data, **kwargs)
+    if layout:
+        fig.update_layout(**layout)
+    return fig.to_dict()
 
 # -------------------------
 # LOAD DATA
 # -------------------------
-df = load_data()
+data = load_data()
 
-if df is None:
+if data is None:
     st.stop()
 
+df, genre_options, author_options, format_options, year_options, quick_stats = data
+
 # -------------------------
 # SIDEBAR - FILTERS & BRANDING
 # -------------------------
@@ -102,33 +286,19 @@ with st.sidebar:
     st.markdown("#### 🔍 Filters")
     
     # Genre Filter
-    genre_options = ["All Genres"] + sorted(df["Genre"].unique().tolist())
     genre_filter = st.multiselect(
         "Genre",
-        options=genre_options,
+        options=["All Genres"] + genre_options,
         default=["All Genres"]
     )
     
-    # Apply genre filter logic
-    if "All Genres" in genre_filter or len(genre_filter) == 0:
-        genre_mask = df["Genre"].notna()
-    else:
-        genre_mask = df["Genre"].isin(genre_filter)
-    
     # Author Filter
-    author_options = ["All Authors"] + sorted(df["Author"].unique().tolist())
     author_filter = st.multiselect(
         "Author",
-        options=author_options,
+        options=["All Authors"] + author_options,
         default=["All Authors"]
     )
     
-    # Apply author filter logic
-    if "All Authors" in author_filter or len(author_filter) == 0:
-        author_mask = df["Author"].notna()
-    else:
-        author_mask = df["Author"].isin(author_filter)
-    
     # Price Range
     price_range = st.slider(
         "Price Range ($)",
@@ -145,35 +315,33 @@ with st.sidebar:
     )
     
     # Format Filter
-    format_options = ["All Formats"] + df["form"].unique().tolist()
-    format_filter = st.selectbox("Format", format_options)
+    format_filter = st.selectbox("Format", ["All Formats"] + format_options)
     
     # Year Filter
-    year_options = ["All Years"] + sorted([y for y in df["Year"].dropna().unique() if not pd.isna(y)], reverse=True)
-    year_filter = st.selectbox("Publication Year", year_options)
+    year_filter = st.selectbox("Publication Year", ["All Years"] + year_options)
     
     st.markdown("---")
     st.markdown("#### 📈 Quick Stats")
-    st.metric("Total Books in DB", len(df))
-    st.metric("Genres", df["Genre"].nunique())
-    st.metric("Authors", df["Author"].nunique())
+    st.metric("Total Books in DB", quick_stats["n"])
+    st.metric("Genres", quick_stats["n_genres"])
+    st.metric("Authors", quick_stats["n_authors"])
 
 # -------------------------
 # APPLY FILTERS
 # -------------------------
-filtered_df = df[genre_mask & author_mask]
-
-# Apply other filters
-filtered_df = filtered_df[
-    (filtered_df["price"].between(price_range[0], price_range[1])) &
-    (filtered_df["Rating"] >= rating_filter)
-]
-
-if format_filter != "All Formats":
-    filtered_df = filtered_df[filtered_df["form"] == format_filter]
+filters = (
+    tuple(genre_filter),
+    tuple(author_filter),
+    tuple(price_range),
+    rating_filter,
+    format_filter,
+    year_filter
+)
+filtered_df = apply_filters(*filters)
 
-if year_filter != "All Years":
-    filtered_df = filtered_df[filtered_df["Year"] == year_filter]
+# Memoized per filtered frame, so reruns with identical filters skip the groupbys
+group_stats = compute_group_stats(filtered_df)
+top_positions = compute_top_positions(filtered_df)
 
 # -------------------------
 # HEADER
@@ -223,9 +391,10 @@ with tab1:
     col_a, col_b = st.columns([2, 1])
     
     with col_a:
-        top_reviews = filtered_df.nlargest(10, "reviews count")
+        top_reviews = filtered_df.iloc[top_positions["reviews"]]
         
-        fig1 = px.bar(
+        fig1 = go.Figure(build_figure(
+            "bar",
             top_reviews,
             y="Book name",
             x="reviews count",
@@ -233,14 +402,14 @@ with tab1:
             title="Top 10 Most Reviewed Books",
             color="Rating",
             color_continuous_scale="viridis",
-            hover_data=["Author", "price", "Genre"]
-        )
-        fig1.update_layout(height=400, yaxis={'categoryorder':'total ascending'})
+            hover_data=["Author", "price", "Genre"],
+            layout=dict(height=400, yaxis={'categoryorder':'total ascending'})
+        ))
         st.plotly_chart(fig1, use_container_width=True)
     
     with col_b:
         st.markdown("#### 📋 Details")
-        for idx, row in top_reviews.head(5).iterrows():
+        for row in top_reviews.head(5).to_dict("records"):
             with st.container():
                 st.markdown(f"**{row['Book name'][:40]}...**")
                 st.caption(f"By {row['Author']}")
@@ -248,9 +417,10 @@ with tab1:
                 st.markdown("---")
 
 with tab2:
-    top_rated = filtered_df.nlargest(10, "Rating")
+    top_rated = filtered_df.iloc[top_positions["rating"]]
     
-    fig2 = px.scatter(
+    fig2 = go.Figure(build_figure(
+        "scatter",
         top_rated,
         x="reviews count",
         y="Rating",
@@ -258,15 +428,16 @@ with tab2:
         color="Genre",
         hover_data=["Book name", "Author", "price"],
         title="Highest Rated Books (size = revenue)",
-        size_max=50
-    )
-    fig2.update_layout(height=400)
+        size_max=50,
+        layout=dict(height=400)
+    ))
     st.plotly_chart(fig2, use_container_width=True)
 
 with tab3:
-    top_revenue = filtered_df.nlargest(10, "Estimated Revenue")
+    top_revenue = filtered_df.iloc[top_positions["revenue"]]
     
-    fig3 = px.bar(
+    fig3 = go.Figure(build_figure(
+        "bar",
         top_revenue,
         y="Book name",
         x="Estimated Revenue",
@@ -274,9 +445,9 @@ with tab3:
         title="Top 10 Revenue Generators",
         color="price",
         color_continuous_scale="reds",
-        hover_data=["Author", "reviews count", "Rating"]
-    )
-    fig3.update_layout(height=400, yaxis={'categoryorder':'total ascending'})
+        hover_data=["Author", "reviews count", "Rating"],
+        layout=dict(height=400, yaxis={'categoryorder':'total ascending'})
+    ))
     st.plotly_chart(fig3, use_container_width=True)
 
 st.markdown("---")
@@ -291,35 +462,31 @@ col_c, col_d = st.columns(2)
 with col_c:
     st.markdown("#### Genre Performance")
     
-    genre_stats = filtered_df.groupby("Genre").agg({
-        "Rating": "mean",
-        "reviews count": "sum",
-        "Estimated Revenue": "sum",
-        "Book name": "count"
-    }).reset_index()
-    genre_stats.columns = ["Genre", "Avg Rating", "Total Reviews", "Est Revenue", "Book Count"]
+    genre_stats = group_stats["genre"]
     
-    fig4 = px.bar(
+    fig4 = go.Figure(build_figure(
+        "bar",
         genre_stats.sort_values("Total Reviews", ascending=False),
         x="Genre",
         y="Total Reviews",
         title="Total Reviews by Genre",
         color="Avg Rating",
-        color_continuous_scale="thermal"
-    )
-    fig4.update_layout(xaxis_tickangle=-45)
+        color_continuous_scale="thermal",
+        layout=dict(xaxis_tickangle=-45)
+    ))
     st.plotly_chart(fig4, use_container_width=True)
 
 with col_d:
     st.markdown("#### Revenue Distribution by Genre")
     
-    fig5 = px.pie(
+    fig5 = go.Figure(build_figure(
+        "pie",
         genre_stats,
         values="Est Revenue",
         names="Genre",
         title="Market Share by Estimated Revenue",
         hole=0.4
-    )
+    ))
     st.plotly_chart(fig5, use_container_width=True)
 
 # -------------------------
@@ -330,12 +497,21 @@ col_e, col_f = st.columns(2)
 with col_e:
     st.markdown("#### 💰 Price Distribution")
     
-    fig6 = px.histogram(
-        filtered_df,
-        x="price",
-        nbins=30,
+    # Bin prices with NumPy so only the 30 bar heights are sent to Plotly
+    prices = filtered_df["price"].to_numpy(dtype=float, na_value=np.nan)
+    counts, edges = np.histogram(prices[~np.isnan(prices)], bins=30)
+    
+    fig6 = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color="#3b82f6"
+    ))
+    fig6.update_layout(
         title="Price Distribution of Bestsellers",
-        color_discrete_sequence=["#3b82f6"]
+        xaxis_title="price",
+        yaxis_title="count",
+        bargap=0
     )
     fig6.add_vline(x=avg_price, line_dash="dash", line_color="red", 
                    annotation_text=f"Avg: ${avg_price}")
@@ -344,15 +520,16 @@ with col_e:
 with col_f:
     st.markdown("#### 📖 Format Preference")
     
-    format_dist = filtered_df["form"].value_counts().reset_index()
+    format_dist = filtered_df["form"].cat.remove_unused_categories().value_counts().reset_index()
     format_dist.columns = ["Format", "Count"]
     
-    fig7 = px.pie(
+    fig7 = go.Figure(build_figure(
+        "pie",
         format_dist,
         values="Count",
         names="Format",
         title="Market Format Distribution"
-    )
+    ))
     st.plotly_chart(fig7, use_container_width=True)
 
 st.markdown("---")
@@ -367,22 +544,37 @@ col_g, col_h = st.columns(2)
 with col_g:
     st.markdown("#### Print Length vs Rating")
     
-    fig8 = px.scatter(
+    fig8 = go.Figure(build_figure(
+        "scatter",
         filtered_df,
         x="Print Length",
         y="Rating",
         size="reviews count",
         color="Genre",
         hover_data=["Book name", "Author", "price"],
-        title="Do Longer Books Get Better Ratings?",
-        trendline="ols"
-    )
+        title="Do Longer Books Get Better Ratings?"
+    ))
+    
+    # Least-squares trend line fitted with NumPy instead of statsmodels OLS
+    fit_df = filtered_df[["Print Length", "Rating"]].dropna()
+    if fit_df["Print Length"].nunique() > 1:
+        lengths = fit_df["Print Length"].to_numpy(dtype=float)
+        slope, intercept = np.polyfit(lengths, fit_df["Rating"].to_numpy(dtype=float), 1)
+        trend_x = np.array([lengths.min(), lengths.max()])
+        fig8.add_trace(go.Scatter(
+            x=trend_x,
+            y=slope * trend_x + intercept,
+            mode="lines",
+            name="Trend",
+            line=dict(color="#1f2937", dash="dash")
+        ))
     st.plotly_chart(fig8, use_container_width=True)
 
 with col_h:
     st.markdown("#### Price vs Reviews")
     
-    fig9 = px.scatter(
+    fig9 = go.Figure(build_figure(
+        "scatter",
         filtered_df,
         x="price",
         y="reviews count",
@@ -391,7 +583,7 @@ with col_h:
         hover_data=["Book name", "Author"],
         title="Are Expensive Books More Popular?",
         color_continuous_scale="viridis"
-    )
+    ))
     st.plotly_chart(fig9, use_container_width=True)
 
 st.markdown("---")
@@ -404,17 +596,12 @@ st.markdown("### 👑 Author Dominance")
 col_i, col_j = st.columns([3, 2])
 
 with col_i:
-    author_stats = filtered_df.groupby("Author").agg({
-        "reviews count": "sum",
-        "Rating": "mean",
-        "Estimated Revenue": "sum",
-        "Book name": "count"
-    }).reset_index()
-    author_stats.columns = ["Author", "Total Reviews", "Avg Rating", "Est Revenue", "Book Count"]
+    author_stats = group_stats["author"]
     
     top_authors = author_stats.nlargest(15, "Total Reviews")
     
-    fig10 = px.bar(
+    fig10 = go.Figure(build_figure(
+        "bar",
         top_authors,
         y="Author",
         x="Total Reviews",
@@ -422,15 +609,15 @@ with col_i:
         title="Top 15 Authors by Total Reviews",
         color="Avg Rating",
         color_continuous_scale="greens",
-        hover_data=["Book Count", "Est Revenue"]
-    )
-    fig10.update_layout(height=500, yaxis={'categoryorder':'total ascending'})
+        hover_data=["Book Count", "Est Revenue"],
+        layout=dict(height=500, yaxis={'categoryorder':'total ascending'})
+    ))
     st.plotly_chart(fig10, use_container_width=True)
 
 with col_j:
     st.markdown("#### 🌟 Top Author Metrics")
     
-    for idx, row in top_authors.head(8).iterrows():
+    for row in top_authors.head(8).to_dict("records"):
         with st.expander(f"**{row['Author']}**"):
             st.metric("Books", int(row['Book Count']))
             st.metric("Avg Rating", f"{row['Avg Rating']:.2f}")
@@ -444,38 +631,33 @@ st.markdown("---")
 # -------------------------
 st.markdown("### 📅 Publishing Trends")
 
-# Filter out NaN years
-trend_df = filtered_df[filtered_df["Year"].notna()].copy()
+# NaN years are already excluded from the yearly aggregation
+yearly_trend = group_stats["year"]
 
-if not trend_df.empty:
+if not yearly_trend.empty:
     col_k, col_l = st.columns(2)
     
     with col_k:
-        yearly_trend = trend_df.groupby("Year").agg({
-            "Book name": "count",
-            "Rating": "mean",
-            "reviews count": "sum"
-        }).reset_index()
-        yearly_trend.columns = ["Year", "Book Count", "Avg Rating", "Total Reviews"]
-        
-        fig11 = px.line(
+        fig11 = go.Figure(build_figure(
+            "line",
             yearly_trend,
             x="Year",
             y="Book Count",
             title="Books Published Over Time",
             markers=True
-        )
+        ))
         st.plotly_chart(fig11, use_container_width=True)
     
     with col_l:
-        fig12 = px.bar(
+        fig12 = go.Figure(build_figure(
+            "bar",
             yearly_trend,
             x="Year",
             y="Total Reviews",
             title="Review Volume by Publication Year",
             color="Avg Rating",
             color_continuous_scale="blues"
-        )
+        ))
         st.plotly_chart(fig12, use_container_width=True)
 else:
     st.info("No publication date data available for filtered results")
@@ -487,31 +669,32 @@ st.markdown("---")
 # -------------------------
 st.markdown("### 📋 Detailed Data Explorer")
 
-# Prepare display dataframe
+# Prepare display dataframe - Arrow-backed columns serialize to the browser
+# without falling back to the pandas object-column conversion path
 display_df = filtered_df[[
     "Rank", "Book name", "Author", "Genre", "Rating", 
     "reviews count", "price", "form", "Print Length", 
     "Publishing date", "Estimated Revenue", "Popularity Score"
-]].sort_values("Rank")
-
-# Format columns
-display_df["price"] = display_df["price"].apply(lambda x: f"${x:.2f}")
-display_df["Estimated Revenue"] = display_df["Estimated Revenue"].apply(lambda x: f"${x:,.0f}")
-display_df["Popularity Score"] = display_df["Popularity Score"].apply(lambda x: f"{x:.1f}")
-display_df["reviews count"] = display_df["reviews count"].apply(lambda x: f"{x:,}")
+]].sort_values("Rank").convert_dtypes(dtype_backend="pyarrow")
 
+# Columns stay numeric; formatting is applied client-side by the column config
 st.dataframe(
     display_df,
     use_container_width=True,
     height=400,
-    hide_index=True
+    hide_index=True,
+    column_config={
+        "price": st.column_config.NumberColumn(format="$%.2f"),
+        "Estimated Revenue": st.column_config.NumberColumn(format="$%,.0f"),
+        "Popularity Score": st.column_config.NumberColumn(format="%.1f"),
+        "reviews count": st.column_config.NumberColumn(format="%,d")
+    }
 )
 
-# Download button
-csv = filtered_df.to_csv(index=False)
+# Download button - the CSV is only serialized once per filter combination
 st.download_button(
     label="📥 Download Filtered Data as CSV",
-    data=csv,
+    data=export_csv(*filters),
     file_name=f"filtered_books_{datetime.now().strftime('%Y%m%d')}.csv",
     mime="text/csv"
 )